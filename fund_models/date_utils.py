@@ -1,8 +1,24 @@
-import calendar
 import datetime
+from functools import lru_cache
 from typing import List
 
 
+_EOM_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+def _is_leap_year(year: int) -> bool:
+    '''
+    Returns whether the year is a leap year in the Gregorian calendar.
+    '''
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+def _eom_day(year: int, month: int) -> int:
+    '''
+    Returns the day number of the last day of the month.
+    '''
+    if month != 2:
+        return _EOM_DAYS[month - 1]
+    return 29 if _is_leap_year(year) else 28
+
 def year_month_num(date: datetime.date) -> int:
     '''
     Returns the year part of date multiplied by 12 plus the month number.
@@ -17,20 +33,18 @@ def end_of_month_from_date(date: datetime.date) -> datetime.date:
     eom = end_of_month_from_int(year_month_int)
     return eom
 
+@lru_cache(maxsize=4096)
 def end_of_month_from_int(year_month_int: int) -> datetime.date:
     '''
     Returns the last day of the month, of the month of the date.
     '''    
-    if year_month_int % 12 != 0:
-        eom_year = year_month_int // 12
-        eom_month = year_month_int % 12
-    else:
-        eom_year = year_month_int // 12 - 1
-        eom_month = 12
-    eom_day = calendar.monthrange(eom_year, eom_month)[1]
+    eom_year, eom_month = divmod(year_month_int - 1, 12)
+    eom_month += 1
+    eom_day = _eom_day(eom_year, eom_month)
     eom = datetime.date(eom_year, eom_month, eom_day)
     return eom
 
+@lru_cache(maxsize=8192)
 def add_n_months(start_date: datetime.date, num_months: int, end_of_month: bool = True) -> datetime.date:
     '''
     Returns a date incremented by the number of monthly intervals specified.
@@ -41,14 +55,10 @@ def add_n_months(start_date: datetime.date, num_months: int, end_of_month: bool
     '''   
     return_date_year_month_int = year_month_num(start_date) + num_months
 
-    if return_date_year_month_int % 12 != 0:
-        return_date_year = return_date_year_month_int // 12
-        return_date_month = return_date_year_month_int % 12
-    else:
-        return_date_year = return_date_year_month_int // 12 - 1
-        return_date_month = 12
+    return_date_year, return_date_month = divmod(return_date_year_month_int - 1, 12)
+    return_date_month += 1
 
-    return_date_day = min(start_date.day, calendar.monthrange(return_date_year, return_date_month)[1])
+    return_date_day = min(start_date.day, _eom_day(return_date_year, return_date_month))
     
     return_date = datetime.date(return_date_year, return_date_month, return_date_day)
 
@@ -78,10 +88,10 @@ def days_in_month(date: datetime.date) -> int:
     '''
     Returns the number of days in a month.
     '''
-    return calendar.monthrange(date.year, date.month)[1]
+    return _eom_day(date.year, date.month)
 
 def days_in_year(date: datetime.date) -> int:
     '''
     Returns the number of days in a year.
     '''
-    return (datetime.date(date.year + 1, 1, 1) -  datetime.date(date.year, 1, 1)).days
\ No newline at end of file
+    return 366 if _is_leap_year(date.year) else 365
\ No newline at end of file
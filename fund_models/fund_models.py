@@ -1,19 +1,141 @@
 import calendar
 import datetime
 import os
-from typing import List, Dict
+from dataclasses import dataclass
+from functools import cached_property
+from typing import List, Dict, Tuple
 
+import numpy as np
 import pandas as pd
-import numpy_financial as npf
+from numba import njit
 
 from fund_models.date_utils import (
     end_of_month_from_date,
     generate_monthly_date_series, 
     add_n_months,
-    days_in_month,
-    days_in_year
+    number_of_months_diff
 )
 
+PROCEEDS_ALLOCATION_SCHEDULES = (
+    "lp_preferred_opening",
+    "lp_preferred_irr_growth",
+    "lp_preferred_payments",
+    "lp_preferred_closing",
+    "catch_up_opening",
+    "catch_up_accruals",
+    "catch_up_payments_gp_share",
+    "catch_up_payments_lp_share",
+    "catch_up_closing",
+    "post_catch_up_payments_gp_share",
+    "post_catch_up_payments_lp_share"
+)
+
+FUND_SCHEDULES = (
+    "deployments",
+    "capital_returns",
+    "closing_invested_capital",
+    "fee_paying_capital",
+    "mgmt_fees",
+    "proceeds",
+) + PROCEEDS_ALLOCATION_SCHEDULES
+
+#waterfall kernel
+
+@njit(cache=True)
+def _waterfall_kernel(proceeds, deployments, irr_hurdle_per_month, carry_percent, carry_catch_up):
+    '''
+    Returns the proceeds allocation schedules, in the order of \
+    PROCEEDS_ALLOCATION_SCHEDULES, as arrays aligned to the proceeds and deployments.
+
+    Only float arrays and scalars are passed in so that the loop compiles in \
+    numba's nopython mode.
+    '''
+    num_months = proceeds.shape[0]
+
+    lp_preferred_opening = np.zeros(num_months)
+    lp_preferred_irr_growth = np.zeros(num_months)
+    lp_preferred_payments = np.zeros(num_months)
+    lp_preferred_closing = np.zeros(num_months)
+
+    catch_up_opening = np.zeros(num_months)
+    catch_up_accruals = np.zeros(num_months)
+    catch_up_payments_gp_share = np.zeros(num_months)
+    catch_up_payments_lp_share = np.zeros(num_months)
+    catch_up_closing = np.zeros(num_months)
+
+    post_catch_up_payments_gp_share = np.zeros(num_months)
+    post_catch_up_payments_lp_share = np.zeros(num_months)
+
+    prev_lp_preferred_closing = 0.0
+    prev_catch_up_closing = 0.0
+
+    for i in range(num_months):
+
+        proceed = proceeds[i]
+        deployment = deployments[i]
+
+        # first calculcate opening lp preferred balance (taking irr_hurdle into account)
+        lp_preferred_opening_balance = prev_lp_preferred_closing
+        lp_preferred_opening[i] = lp_preferred_opening_balance
+
+        lp_preferred_irr_growth_for_month = lp_preferred_opening_balance * irr_hurdle_per_month
+        lp_preferred_irr_growth[i] = lp_preferred_irr_growth_for_month
+
+        lp_preferred_payment = min(proceed, lp_preferred_opening_balance + lp_preferred_irr_growth_for_month + deployment)
+        lp_preferred_payments[i] = lp_preferred_payment
+        lp_preferred_closing[i] = lp_preferred_opening_balance + lp_preferred_irr_growth_for_month + deployment - lp_preferred_payment
+
+        #catch opening and accrual
+        catch_up_opening_balance = prev_catch_up_closing
+        catch_up_opening[i] = catch_up_opening_balance
+
+        #We must apply a fraction to the accrual so that the GP also shares in the carry catch up payments
+        catch_up_accrual =  lp_preferred_irr_growth_for_month * (carry_percent / ( 0.5 - carry_percent) * 0.5) * carry_catch_up
+        catch_up_accruals[i] = catch_up_accrual
+
+        # if lp preferred return is all paid, the GP is able to catch up performance fees
+        # from the preferred return period (in agreed percentages)
+        if proceed > lp_preferred_payment:
+
+            #catch up payment limited to balance
+            catch_up_payment = min((catch_up_opening_balance + catch_up_accrual) / 0.5, proceed - lp_preferred_payment)
+
+            catch_up_payment_gp_share = catch_up_payment * 0.5
+            catch_up_payment_lp_share = catch_up_payment * 0.5
+
+            catch_up_payments_gp_share[i] = catch_up_payment_gp_share
+            catch_up_payments_lp_share[i] = catch_up_payment_lp_share
+
+            catch_up_closing[i] = catch_up_opening_balance + catch_up_accrual - catch_up_payment_gp_share
+
+            # once the GP has caught up, perf fees are split in agreed proportions
+            if proceed > lp_preferred_payment + catch_up_payment:
+                post_catch_up_payment = proceed - lp_preferred_payment - catch_up_payment
+
+                post_catch_up_payments_lp_share[i] = post_catch_up_payment * (1 - carry_percent)
+                post_catch_up_payments_gp_share[i] = post_catch_up_payment * carry_percent
+
+        else:
+            # lp_preferred is still being paid, therefore accrue catch up regularly
+            catch_up_closing[i] = catch_up_opening_balance + catch_up_accrual
+
+        prev_lp_preferred_closing = lp_preferred_closing[i]
+        prev_catch_up_closing = catch_up_closing[i]
+
+    return (
+        lp_preferred_opening,
+        lp_preferred_irr_growth,
+        lp_preferred_payments,
+        lp_preferred_closing,
+        catch_up_opening,
+        catch_up_accruals,
+        catch_up_payments_gp_share,
+        catch_up_payments_lp_share,
+        catch_up_closing,
+        post_catch_up_payments_gp_share,
+        post_catch_up_payments_lp_share
+    )
+
 #exception classes
 
 class ClosedEndFundError(Exception):
@@ -22,6 +144,15 @@ class ClosedEndFundError(Exception):
 
 #fund classes
 
+@dataclass
+class _Timeline:
+    '''
+    Monthly schedules of a fund, stored as one array per schedule \
+    aligned to a shared array of month end dates.
+    '''
+    dates: np.ndarray
+    schedules: Dict[str, np.ndarray]
+
 class ClosedEndFund():
 
     def __init__(self,
@@ -76,30 +207,36 @@ class ClosedEndFund():
         self.length_of_deployment_in_months = length_of_deployment_in_months
         self.carry_catch_up = carry_catch_up
 
-    @property
-    def monthly_date_series(self) -> List[datetime.date]:
+        # monthly rates derived from the annual effective irr and irr hurdle
+        self.irr_per_month = (1 + annual_effective_irr) ** (1/12) -1
+        self.irr_hurdle_per_month = (1 + annual_effective_irr_hurdle) ** (1/12) -1
+        self._growth_factor = (1 + self.irr_per_month) ** self.length_of_deployment_in_months
+
+    @cached_property
+    def _monthly_dates(self) -> Tuple[datetime.date, ...]:
         '''
-        A complete schedule of month ends between the fund start date and last capital return.
+        The cached month ends between the fund start date and last capital return.
         '''
-        return generate_monthly_date_series(self.fund_start_date, max(self.generate_capital_returns()))
+        return tuple(generate_monthly_date_series(self.fund_start_date, max(self.capital_returns)))
 
     @property
-    def irr_per_month(self) -> float:
+    def monthly_date_series(self) -> List[datetime.date]:
         '''
-        Derived from the annual effective irr.
+        A complete schedule of month ends between the fund start date and last capital return.
         '''
-        return (1 + self.annual_effective_irr) ** (1/12) -1
+        return list(self._monthly_dates)
 
-    @property
-    def irr_hurdle_per_month(self) -> float:
+    @cached_property
+    def last_deployment_date(self) -> datetime.date:
         '''
-        Derived from the annual effective irr hurdle.
+        The date of the final deployment.
         '''
-        return (1 + self.annual_effective_irr_hurdle) ** (1/12) -1
+        return max(self.deployments)
 
-    def generate_deployments(self) -> Dict[datetime.date, float]:
+    @cached_property
+    def deployments(self) -> Dict[datetime.date, float]:
         '''
-        Returns a schedule of deployments.
+        A schedule of deployments.
 
         Deployments amounts and number of deployments are calculcated from fund arguments.        
         '''
@@ -109,16 +246,15 @@ class ClosedEndFund():
         amount_per_deployment = self.committed_capital / number_of_deployments
 
         for num in range(0, number_of_deployments):
-            deployments.update({
-                add_n_months(self.deployment_start_date, num * self.number_of_months_in_between_deployments):
-                amount_per_deployment
-            })
+            deployment_date = add_n_months(self.deployment_start_date, num * self.number_of_months_in_between_deployments)
+            deployments[deployment_date] = amount_per_deployment
 
         return deployments
 
-    def generate_proceeds(self) -> Dict[datetime.date, float]:
+    @cached_property
+    def proceeds(self) -> Dict[datetime.date, float]:
         '''
-        Returns a schedule of proceeds received by the fund that \
+        A schedule of proceeds received by the fund that \
         is based on the deployments schedule.
 
         The timing is based on the length in deployment and \
@@ -126,44 +262,53 @@ class ClosedEndFund():
         which is converted to an irr_per_month.     
         '''
         proceeds = {}
-        for date, value in self.generate_deployments().items():
-            amount = npf.fv(
-                        rate=self.irr_per_month, 
-                        nper=self.length_of_deployment_in_months, 
-                        pmt=0, 
-                        pv=-value, 
-                        when='end'
-                    )
-            proceeds.update(
-                {add_n_months(date, self.length_of_deployment_in_months): amount}
-            )
+        for date, value in self.deployments.items():
+            amount = value * self._growth_factor
+            proceeds[add_n_months(date, self.length_of_deployment_in_months)] = amount
         return proceeds
 
-    def generate_capital_returns(self) -> Dict[datetime.date, float]:
+    @cached_property
+    def capital_returns(self) -> Dict[datetime.date, float]:
         '''
-        Returns a schedule of capital returns received by the fund that \
+        A schedule of capital returns received by the fund that \
         is based on the deployments schedule.
 
         The timing is based on the length in deployment.    
         '''
         capital_returns = {}        
-        for date, value in self.generate_deployments().items():
-                capital_returns.update(
-                    {add_n_months(date, self.length_of_deployment_in_months): value}
-                )
+        for date, value in self.deployments.items():
+            capital_returns[add_n_months(date, self.length_of_deployment_in_months)] = value
         return capital_returns
     
+    def generate_deployments(self) -> Dict[datetime.date, float]:
+        '''
+        Returns a schedule of deployments.
+        '''
+        return dict(self.deployments)
+
+    def generate_proceeds(self) -> Dict[datetime.date, float]:
+        '''
+        Returns a schedule of proceeds received by the fund.
+        '''
+        return dict(self.proceeds)
+
+    def generate_capital_returns(self) -> Dict[datetime.date, float]:
+        '''
+        Returns a schedule of capital returns received by the fund.
+        '''
+        return dict(self.capital_returns)
+
     def generate_profits(self) -> Dict[datetime.date, float]:
         '''
         Returns a schedule of profits by month, which is calculated: \
         proceeds less capital return.
         '''
-        profits = {}
-        capital_returns = self.generate_capital_returns()
-        for date, value in self.generate_proceeds().items():
-            profit = value - capital_returns.get(date)
-            profits.update({date: profit})
-        return profits
+        # proceeds and capital returns are both built from the deployments in order,
+        # so their dates are aligned
+        return {
+            date: proceed - capital_return
+            for (date, proceed), capital_return in zip(self.proceeds.items(), self.capital_returns.values())
+        }
 
     def calculate_total_profit(self) -> float:
         '''
@@ -171,120 +316,114 @@ class ClosedEndFund():
         '''
         return sum(self.generate_profits().values())
 
-    def generate_proceeds_allocations_as_dict(self) -> Dict[str, Dict[datetime.date, float]]:
+    @cached_property
+    def _timeline(self) -> "_Timeline":
         '''
-        Returns multiple schedules that show how proceeds are to be allocated \
-        between the limited and general partners.
-
-        All proceeds are distributed to the limited partners until all deployed capital has been \
-        repaid along with a hurdle return.
-
-        Thereafter, if the general partner is entitled to a share in the preferred return \
-        payments are shared equally between the general and limited partners until the general partner \
-        has received an amount equal to their share of preferred return.
-
-        Thereafter the general partner participates in proceeds based on the agreed carry, with \
-        the balance allocated to the limited partners.        
+        The deployment, capital and management fee schedules of the fund, \
+        aligned to the monthly date series.
         '''
-        deployments = self.generate_deployments()
-        proceeds = self.generate_proceeds()
-        capital_returns = self.generate_capital_returns()
-
-        lp_preferred_opening = {}        
-        lp_preferred_irr_growth = {}
-        lp_preferred_payments = {}
-        lp_preferred_closing = {}
-
-        catch_up_opening = {}
-        catch_up_accruals = {}
-        catch_up_payments_gp_share = {}
-        catch_up_payments_lp_share = {}
-        catch_up_closing = {}
-
-        post_catch_up_payments_gp_share = {}
-        post_catch_up_payments_lp_share = {}
-
-        #cycle through each date and attribute profit shares
-        for date in self.monthly_date_series:
+        return self._compute_timeline()
 
-            proceed = proceeds.get(date, 0)
+    @cached_property
+    def _proceeds_allocations(self) -> Dict[str, np.ndarray]:
+        '''
+        The proceeds allocation schedules of the fund, aligned to the monthly date series.
+        '''
+        return self._compute_proceeds_allocations()
 
-            # first calculcate opening lp preferred balance (taking irr_hurdle into account)
-            lp_preferred_opening_balance = lp_preferred_closing.get(add_n_months(date, -1), 0)
-            lp_preferred_opening.update({date: lp_preferred_opening_balance})
-            
-            lp_preferred_irr_growth_for_month = lp_preferred_opening_balance * self.irr_hurdle_per_month
-            lp_preferred_irr_growth.update({date: lp_preferred_irr_growth_for_month})
-            
-            deployment = deployments.get(date, 0)
+    def _to_timeline_array(self, schedule: Dict[datetime.date, float]) -> np.ndarray:
+        '''
+        Returns a date keyed schedule as an array aligned to the monthly date series, \
+        with zeros for months that are not in the schedule.
+        '''
+        values = np.zeros(len(self._monthly_dates))
+        for date, value in schedule.items():
+            values[number_of_months_diff(self.fund_start_date, date)] = value
+        return values
 
-            lp_preferred_payment = min(proceed, lp_preferred_opening_balance + lp_preferred_irr_growth_for_month + deployment)
-            lp_preferred_payments.update({date: lp_preferred_payment})
-            lp_preferred_closing.update({date: lp_preferred_opening_balance + lp_preferred_irr_growth_for_month + deployment - lp_preferred_payment})
+    def _compute_timeline(self) -> "_Timeline":
+        '''
+        Returns the deployment, capital and management fee schedules of the fund \
+        as arrays aligned to the monthly date series.
 
-            #catch opening and accrual
-            catch_up_opening_balance = catch_up_closing.get(add_n_months(date, -1), 0)
-            catch_up_opening.update({date: catch_up_opening_balance})
+        The proceeds allocations are kept out of the timeline so that these \
+        schedules do not depend on the waterfall.
+        '''
+        dates = np.array(self._monthly_dates, dtype='datetime64[D]')
+        last_deployment_index = number_of_months_diff(self.fund_start_date, self.last_deployment_date)
 
-            #We must apply a fraction to the accrual so that the GP also shares in the carry catch up payments
-            catch_up_accrual =  lp_preferred_irr_growth_for_month * (self.carry_percent / ( 0.5 - self.carry_percent) * 0.5) * self.carry_catch_up             
-            catch_up_accruals.update({date: catch_up_accrual})
+        proceeds = self._to_timeline_array(self.proceeds)
+        deployments = self._to_timeline_array(self.deployments)
+        capital_returns = self._to_timeline_array(self.capital_returns)
 
-            # if lp preferred return is all paid, the GP is able to catch up performance fees
-            # from the preferred return period (in agreed percentages)           
-            if proceed > lp_preferred_payment:
+        #invested capital: opening balance + deployment - capital return
+        closing_invested_capital = np.cumsum(deployments - capital_returns)
 
-                #catch up payment limited to balance
-                catch_up_payment = min((catch_up_opening_balance + catch_up_accrual) / 0.5, proceed - lp_preferred_payment)       
+        #fees are based on committed capital until deployments cease, thereafter on invested capital
+        fee_paying_capital = np.where(
+            np.arange(len(dates)) <= last_deployment_index,
+            float(self.committed_capital),
+            closing_invested_capital
+        )
 
-                catch_up_payment_gp_share = catch_up_payment * 0.5
-                catch_up_payment_lp_share = catch_up_payment * 0.5
+        #dates are month ends, so the day of the month is the number of days in the month
+        years = dates.astype('datetime64[Y]')
+        num_days_in_month = (dates - dates.astype('datetime64[M]')).astype(np.float64) + 1
+        num_days_in_year = ((years + 1).astype('datetime64[D]') - years.astype('datetime64[D]')).astype(np.float64)
 
-                catch_up_payments_gp_share.update({date: catch_up_payment_gp_share})
-                catch_up_payments_lp_share.update({date: catch_up_payment_lp_share})
+        mgmt_fees = fee_paying_capital * self.annual_mgmt_fee_rate \
+            * num_days_in_month / num_days_in_year
 
-                catch_up_closing.update({date: catch_up_opening_balance + catch_up_accrual - catch_up_payment_gp_share})
+        schedules = {
+            "deployments": deployments,
+            "capital_returns": capital_returns,
+            "closing_invested_capital": closing_invested_capital,
+            "fee_paying_capital": fee_paying_capital,
+            "mgmt_fees": mgmt_fees,
+            "proceeds": proceeds,
+        }
 
-                # once the GP has caught up, perf fees are split in agreed proportions
-                if proceed > lp_preferred_payment + catch_up_payment:
-                    post_catch_up_payment = proceed - lp_preferred_payment - catch_up_payment
+        return _Timeline(dates=dates, schedules=schedules)
 
-                    post_catch_up_payment_lp_share = post_catch_up_payment * (1 - self.carry_percent)
-                    post_catch_up_payment_gp_share = post_catch_up_payment * self.carry_percent
+    def _compute_proceeds_allocations(self) -> Dict[str, np.ndarray]:
+        '''
+        Returns the proceeds allocation schedules of the fund, calculated by \
+        the waterfall kernel, as arrays aligned to the monthly date series.
+        '''
+        timeline = self._timeline
 
-                    post_catch_up_payments_gp_share.update({date: post_catch_up_payment_gp_share})
-                    post_catch_up_payments_lp_share.update({date: post_catch_up_payment_lp_share})
+        proceeds_allocations = _waterfall_kernel(
+            timeline.schedules["proceeds"],
+            timeline.schedules["deployments"],
+            float(self.irr_hurdle_per_month),
+            float(self.carry_percent),
+            float(self.carry_catch_up)
+        )
 
-                else:
-                    post_catch_up_payments_gp_share.update({date: 0})
-                    post_catch_up_payments_lp_share.update({date: 0})
+        return dict(zip(PROCEEDS_ALLOCATION_SCHEDULES, proceeds_allocations))
 
-            else:
-                # lp_preferred is still being paid, therefore accrue catch up regularly
-                catch_up_closing.update({date: catch_up_opening_balance + catch_up_accrual})
+    def _schedule_as_dict(self, values: np.ndarray) -> Dict[datetime.date, float]:
+        '''
+        Returns one of the fund's monthly schedules keyed by date.
+        '''
+        return dict(zip(self._monthly_dates, values.tolist()))
 
-                catch_up_payments_gp_share.update({date: 0})
-                catch_up_payments_lp_share.update({date: 0})
-                
-                post_catch_up_payments_gp_share.update({date: 0})
-                post_catch_up_payments_lp_share.update({date: 0})   
+    def generate_proceeds_allocations_as_dict(self) -> Dict[str, Dict[datetime.date, float]]:
+        '''
+        Returns multiple schedules that show how proceeds are to be allocated \
+        between the limited and general partners.
 
-        schedules = {
+        All proceeds are distributed to the limited partners until all deployed capital has been \
+        repaid along with a hurdle return.
 
-            "lp_preferred_opening": lp_preferred_opening,
-            "lp_preferred_irr_growth": lp_preferred_irr_growth,
-            "lp_preferred_payments": lp_preferred_payments,
-            "lp_preferred_closing": lp_preferred_closing,
-            "catch_up_opening": catch_up_opening,
-            "catch_up_accruals": catch_up_accruals,
-            "catch_up_payments_gp_share": catch_up_payments_gp_share,
-            "catch_up_payments_lp_share": catch_up_payments_lp_share,
-            "catch_up_closing": catch_up_closing,
-            "post_catch_up_payments_gp_share": post_catch_up_payments_gp_share,
-            "post_catch_up_payments_lp_share": post_catch_up_payments_lp_share
-        }
+        Thereafter, if the general partner is entitled to a share in the preferred return \
+        payments are shared equally between the general and limited partners until the general partner \
+        has received an amount equal to their share of preferred return.
 
-        return schedules
+        Thereafter the general partner participates in proceeds based on the agreed carry, with \
+        the balance allocated to the limited partners.        
+        '''
+        return {name: self._schedule_as_dict(values) for name, values in self._proceeds_allocations.items()}
 
     def generate_closing_invested_capital(self) -> Dict[datetime.date, float]:
         '''
@@ -292,19 +431,7 @@ class ClosedEndFund():
 
         Closing invested capital is calculated: opening balance + deployment - capital return.
         '''
-        closing_invested_capital = {}
-        
-        deployments = self.generate_deployments()
-        capital_returns = self.generate_capital_returns()
-
-        for date in self.monthly_date_series:
-            opening_balance = closing_invested_capital.get(add_n_months(date, -1), 0)
-            deployment = deployments.get(date, 0)
-            capital_return = capital_returns.get(date, 0)
-            closing_balance = opening_balance + deployment - capital_return        
-            closing_invested_capital.update({date:closing_balance})
-        
-        return closing_invested_capital
+        return self._schedule_as_dict(self._timeline.schedules["closing_invested_capital"])
 
     def generate_fee_paying_capital(self) -> Dict[datetime.date, float]:
         '''
@@ -313,19 +440,7 @@ class ClosedEndFund():
         Fees are calculated on commited capital until deployments cease, whereafter \
         fees are based on closing invested capital.
         '''
-        fee_paying_capital = {}
-        closing_invested_capital = self.generate_closing_invested_capital()
-        last_deployments = max([k for k, v in self.generate_deployments().items()])
-
-        for date in self.monthly_date_series:
-            if date <= last_deployments:
-                capital = self.committed_capital
-            else:
-                capital = closing_invested_capital.get(date, 0)        
-                
-            fee_paying_capital.update({date: capital})
-
-        return fee_paying_capital
+        return self._schedule_as_dict(self._timeline.schedules["fee_paying_capital"])
 
     def generate_mgmt_fees(self) -> Dict[datetime.date, float]:
         '''
@@ -334,25 +449,7 @@ class ClosedEndFund():
         Fees are calculated on commited capital until deployments cease, whereafter \
         fees are based on closing invested capital.
         '''
-        mgmt_fees = {}
-        closing_invested_capital = self.generate_closing_invested_capital()
-        last_deployments = max([k for k, v in self.generate_deployments().items()])
-
-        for date in self.monthly_date_series:
-            num_days_in_month = days_in_month(date)
-            num_days_in_year = days_in_year(date)
-            closing_invested_capital_balance = closing_invested_capital.get(date, 0)
-                        
-            if date <= last_deployments:
-                fee = self.committed_capital * self.annual_mgmt_fee_rate \
-                    * num_days_in_month / num_days_in_year
-            else:
-                fee = closing_invested_capital_balance * self.annual_mgmt_fee_rate \
-                    * num_days_in_month / num_days_in_year
-            
-            mgmt_fees.update({date: fee})
-
-        return mgmt_fees
+        return self._schedule_as_dict(self._timeline.schedules["mgmt_fees"])
 
     def generate_fund_inputs_summary_dict(self) -> Dict[str, any]:
         '''
@@ -378,7 +475,7 @@ class ClosedEndFund():
         Returns all the schedules related to the fund.
         '''
         schedules = {
-            "dates": {date: date for date in self.monthly_date_series},
+            "dates": {date: date for date in self._monthly_dates},
             "deployments": self.generate_deployments(),
             "capital_returns": self.generate_capital_returns(),
             "closing_invested_capital": self.generate_closing_invested_capital(),
@@ -394,11 +491,12 @@ class ClosedEndFund():
         '''
         Returns all the schedules related to the fund.
         '''
-        data_to_convert_to_df = self.generate_fund_schedules_summary_dict()
-        sub_dfs = [pd.DataFrame.from_dict(data, orient='index', columns=[col_name]) for col_name, data in data_to_convert_to_df.items()]
-        df = pd.concat(sub_dfs, axis=1).drop(columns=['dates'], axis=1)
-        df['fund_name'] = self.fund_name
-        return df.fillna(0)
+        timeline = self._timeline
+        schedules = {**timeline.schedules, **self._proceeds_allocations}
+        data_to_convert_to_df = {name: schedules[name] for name in FUND_SCHEDULES}
+        data_to_convert_to_df['fund_name'] = self.fund_name
+        df = pd.DataFrame(data_to_convert_to_df, index=pd.DatetimeIndex(timeline.dates))
+        return df
 
     def generate_fund_inputs_summary_df(self) -> pd.DataFrame:
         '''
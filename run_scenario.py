@@ -65,24 +65,14 @@ funds = [
             )
 ]
 
-fund_schedules_df = pd.concat([fund.generate_fund_schedules_summary_df() for fund in funds])
-fund_inputs_df = pd.concat([fund.generate_fund_inputs_summary_df() for fund in funds])
-
-try:
-    os.remove('power_bi_datasets/fund_schedules.csv')
-except:
-    pass
-
-try:
-    os.remove('power_bi_datasets/fund_inputs.csv')
-except:
-    pass
-
-fund_schedules_df.to_csv('power_bi_datasets/fund_schedules.csv', index_label='date')
-fund_inputs_df.to_csv('power_bi_datasets/fund_inputs.csv', index=False)
-
-with open('power_bi_datasets/path_for_power_bi.txt', 'w') as path_for_power_bi:
-    path_for_power_bi.write(os.getcwd())
+if __name__ == '__main__':
 
+    fund_schedules_df = pd.concat([fund.generate_fund_schedules_summary_df() for fund in funds])
+    fund_inputs_df = pd.concat([fund.generate_fund_inputs_summary_df() for fund in funds])
 
+    # to_csv overwrites the existing datasets in a single write
+    fund_schedules_df.to_csv('power_bi_datasets/fund_schedules.csv', index_label='date', date_format='%Y-%m-%d')
+    fund_inputs_df.to_csv('power_bi_datasets/fund_inputs.csv', index=False)
 
+    with open('power_bi_datasets/path_for_power_bi.txt', 'w') as path_for_power_bi:
+        path_for_power_bi.write(os.getcwd())
@@ -0,0 +1,36 @@
+import datetime
+
+import pytest
+
+from fund_models.fund_models import ClosedEndFund
+
+
+def make_fund(**kwargs) -> ClosedEndFund:
+    fund_args = dict(
+        fund_name='Fund1',
+        fund_start_date=datetime.date(2021, 3, 31),
+        deployment_start_date=datetime.date(2021, 6, 30),
+        annual_effective_irr=0.15,
+        committed_capital=500000000,
+        annual_mgmt_fee_rate=0.005,
+        carry_percent=0.2,
+        annual_effective_irr_hurdle=0.1,
+    )
+    fund_args.update(kwargs)
+    return ClosedEndFund(**fund_args)
+
+def test_capital_schedules_do_not_depend_on_waterfall():
+    '''
+    The invested capital and management fee schedules must not depend on \
+    the proceeds allocation waterfall, which fails for a carry of 50% because \
+    the catch up accrual divides by 0.5 less the carry.
+    '''
+    fund = make_fund(carry_percent=0.5)
+
+    closing_invested_capital = fund.generate_closing_invested_capital()
+    fee_paying_capital = fund.generate_fee_paying_capital()
+    mgmt_fees = fund.generate_mgmt_fees()
+
+    assert list(closing_invested_capital) == fund.monthly_date_series
+    assert fee_paying_capital[fund.fund_start_date] == fund.committed_capital
+    assert mgmt_fees[fund.fund_start_date] == pytest.approx(500000000 * 0.005 * 31 / 365)